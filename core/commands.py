@@ -21,6 +21,7 @@ class ReplProtocol(Protocol):
     def new_program(self) -> None: ...
     def list_variables(self) -> None: ...
     def clear_screen(self) -> None: ...
+    def process_lines(self, lines) -> int: ...
 
 
 class CommandRegistry:
@@ -32,11 +33,15 @@ class CommandRegistry:
     def __init__(self):
         self.commands: Dict[str, Callable] = {}
         self.command_help: Dict[str, str] = {}
+        # Whether each handler wants the command line too - worked out once
+        # at registration instead of inspecting the signature on every call
+        self.takes_line: Dict[str, bool] = {}
         self.register_built_in_commands()
     
     def register(self, name: str, handler: Callable, help_text: str = "") -> None:
         """Register a command handler"""
         self.commands[name.upper()] = handler
+        self.takes_line[name.upper()] = len(inspect.signature(handler).parameters) > 1
         if help_text:
             self.command_help[name.upper()] = help_text
     
@@ -45,33 +50,19 @@ class CommandRegistry:
         Execute a command if it matches a registered handler.
         Returns True if command was handled, False otherwise.
         """
-        command_upper = command_line.strip().upper()
-        parts = command_line.strip().split(maxsplit=1)
+        parts = command_line.split(None, 1)
         command = parts[0].upper() if parts else ""
         
-        # Try exact match first
-        if command in self.commands:
-            handler = self.commands[command]
-            # Check if handler accepts command_line argument
-            sig = inspect.signature(handler)
-            if len(sig.parameters) > 1:
-                handler(repl, command_line)
-            else:
-                handler(repl)
-            return True
-        
-        # Try prefix match for commands that take arguments
-        for cmd_name, handler in self.commands.items():
-            if command_upper.startswith(cmd_name + " ") or command_upper == cmd_name:
-                # Check if handler accepts command_line argument
-                sig = inspect.signature(handler)
-                if len(sig.parameters) > 1:
-                    handler(repl, command_line)
-                else:
-                    handler(repl)
-                return True
+        # Command names are single words, so the first word decides
+        handler = self.commands.get(command)
+        if handler is None:
+            return False
         
-        return False
+        if self.takes_line[command]:
+            handler(repl, command_line)
+        else:
+            handler(repl)
+        return True
     
     def register_built_in_commands(self) -> None:
         """Register all built-in BASIC commands"""
@@ -204,9 +195,7 @@ def cmd_save(repl: ReplProtocol, command_line: str) -> None:
         return
     
     # Create program text
-    program_text = ""
-    for line_num, code in lines:
-        program_text += f"{line_num} {code}\n"
+    program_text = ''.join([f"{line_num} {code}\n" for line_num, code in lines])
     
     # Save to NCDOS disk
     if repl.disk.save_file(filename, program_text.encode('ascii')):
@@ -253,15 +242,9 @@ def cmd_load(repl: ReplProtocol, command_line: str) -> None:
     # Parse and store lines
     try:
         text = data.decode('ascii')
-        line_count = 0
-        for line in text.split('\n'):
-            line = line.strip()
-            if line:
-                # Process the line through the REPL
-                # This will handle line numbering and tokenization
-                if hasattr(repl, 'process_line'):
-                    repl.process_line(line)
-                    line_count += 1
+        # Hand the whole file to the REPL in one batch
+        # It handles line numbering and tokenization
+        line_count = repl.process_lines(text.split('\n'))
         print(f"Loaded {line_count} lines from {filename}")
     except Exception as e:
         print(f"Error loading program: {e}")
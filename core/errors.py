@@ -0,0 +1,8 @@
+"""
+Runtime errors for ZenBasic
+For when the parser said yes but the program still said no
+"""
+
+
+class BasicRuntimeError(Exception):
+    """An error raised while running BASIC code (division by zero, undefined variable, ...)"""
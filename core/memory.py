@@ -24,6 +24,12 @@ HARDWARE_END = 0xFFFF
 SYMBOL_TABLE_START = SYSTEM_START
 SYMBOL_TABLE_END = SYSTEM_END
 
+# 16-bit little-endian words, packed and unpacked in place by the C struct code
+_PACK_U16 = struct.Struct('<H').pack_into
+_UNPACK_U16 = struct.Struct('<H').unpack_from
+_PACK_F32 = struct.Struct('<f').pack_into
+_UNPACK_F32 = struct.Struct('<f').unpack_from
+
 # Memory header structure at 0x0200
 HEADER_VAR_COUNT = 0x0200      # 16-bit: Number of variables
 HEADER_NEXT_SYMBOL = 0x0202    # 16-bit: Offset to next free symbol slot
@@ -34,6 +40,13 @@ SYMBOL_DATA_START = 0x0208     # Actual symbol entries start here
 # Program storage
 DEFAULT_PAGE = PROGRAM_START   # Default PAGE value (0x1000)
 
+# Screen geometry
+SCREEN_COLS = 40
+SCREEN_ROWS = 25
+
+# Screen byte -> displayable character (anything unprintable shows as a space)
+SCREEN_CHARSET = bytes(c if 32 <= c <= 126 else 0x20 for c in range(256))
+
 class MemoryManager:
     """Manages the 64K memory space for ZenBasic"""
     
@@ -49,47 +62,49 @@ class MemoryManager:
         
         # Initialize program storage
         self.program_top = DEFAULT_PAGE  # Current end of program
+        
+        # Bumped whenever the symbol table is wiped, so anyone caching
+        # variable addresses knows to throw them away
+        self.symbol_generation = 0
+        
+        self.screen_cursor = SCREEN_START
     
     def store_int16(self, address: int, value: int) -> None:
         """Store 16-bit integer at address, little endian"""
         if address < 0 or address + 1 >= self.size:
             raise ValueError(f"Address {address:04X} out of range")
         
-        value = int(value) & 0xFFFF  # Clamp to 16-bit
-        self.memory[address] = value & 0xFF        # Low byte first
-        self.memory[address + 1] = (value >> 8) & 0xFF  # High byte second
+        _PACK_U16(self.memory, address, int(value) & 0xFFFF)  # Clamp to 16-bit, low byte first
     
     def read_int16(self, address: int) -> int:
         """Read 16-bit integer from address, little endian"""
         if address < 0 or address + 1 >= self.size:
             raise ValueError(f"Address {address:04X} out of range")
         
-        low_byte = self.memory[address]
-        high_byte = self.memory[address + 1]
-        return low_byte | (high_byte << 8)
+        return _UNPACK_U16(self.memory, address)[0]
     
     def store_float32(self, address: int, value: float) -> None:
         """Store 32-bit float at address, little endian"""
         if address < 0 or address + 3 >= self.size:
             raise ValueError(f"Address {address:04X} out of range")
         
-        # Convert Python float to 32-bit IEEE 754 bytes
-        bytes_data = struct.pack('<f', value)  # '<' for little endian, 'f' for float32
-        
-        # Store the 4 bytes
-        for i, byte in enumerate(bytes_data):
-            self.memory[address + i] = byte
+        # Python float to 32-bit IEEE 754, written straight into memory
+        _PACK_F32(self.memory, address, value)
     
     def read_float32(self, address: int) -> float:
         """Read 32-bit float from address, little endian"""
         if address < 0 or address + 3 >= self.size:
             raise ValueError(f"Address {address:04X} out of range")
         
-        # Read 4 bytes
-        bytes_data = bytes(self.memory[address:address + 4])
+        # IEEE 754 bytes back to a Python float
+        return _UNPACK_F32(self.memory, address)[0]
+    
+    def store_bytes(self, address: int, data: bytes) -> None:
+        """Store a block of bytes at address in one go"""
+        if address < 0 or address + len(data) > self.size:
+            raise ValueError(f"Address {address:04X} out of range")
         
-        # Convert from IEEE 754 bytes back to Python float
-        return struct.unpack('<f', bytes_data)[0]
+        self.memory[address:address + len(data)] = data
     
     def allocate_variable(self, name: str, size: int) -> int:
         """Allocate space for a variable, return its address"""
@@ -125,24 +140,20 @@ class MemoryManager:
     
     def dump(self, start_addr: int, length: int = 64) -> None:
         """Dump memory contents in hex format"""
-        print(f"Memory dump starting at ${start_addr:04X}:")
+        lines = [f"Memory dump starting at ${start_addr:04X}:"]
         
-        for i in range(0, length, 16):
-            addr = start_addr + i
-            if addr >= self.size:
-                break
-            
-            # Address
-            line = f"${addr:04X}: "
-            
-            # Hex bytes
-            for j in range(16):
-                if addr + j < self.size:
-                    line += f"{self.memory[addr + j]:02X} "
-                else:
-                    line += "   "
+        # Rows are read through a view, so slicing them copies nothing
+        with memoryview(self.memory) as view:
+            for i in range(0, length, 16):
+                addr = start_addr + i
+                if addr >= self.size:
+                    break
+                
+                # Address, then the row's hex bytes (a short last row is padded)
+                hex_bytes = view[addr:addr + 16].hex(' ').upper()
+                lines.append(f"${addr:04X}: {hex_bytes + ' ':<48}")
             
-            print(line)
+        print('\n'.join(lines))
     
     def clear_variables(self) -> None:
         """Clear variable allocation table (but not the memory itself)"""
@@ -150,6 +161,7 @@ class MemoryManager:
         self.store_int16(HEADER_VAR_COUNT, 0)
         self.store_int16(HEADER_NEXT_SYMBOL, SYMBOL_DATA_START)
         self.store_int16(HEADER_NEXT_VAR, VARS_START)
+        self.symbol_generation += 1
     
     def write_symbol_entry(self, name: str, address: int, size: int) -> Optional[int]:
         """Write a symbol table entry to memory. Returns address of entry or None if no space."""
@@ -165,25 +177,13 @@ class MemoryManager:
             
         entry_addr = next_symbol_address
         
-        # Write the entry
-        ptr = entry_addr
-        self.memory[ptr] = len(name_bytes)  # Name length
-        ptr += 1
-        
-        for byte in name_bytes:  # Name characters
-            self.memory[ptr] = byte
-            ptr += 1
-            
-        self.memory[ptr] = address & 0xFF  # Address low byte
-        ptr += 1
-        self.memory[ptr] = (address >> 8) & 0xFF  # Address high byte
-        ptr += 1
-        
-        self.memory[ptr] = size  # Variable size
-        ptr += 1
+        # Write the whole entry at once: name length, name characters,
+        # address (low byte first), variable size
+        self.store_bytes(entry_addr, bytes((len(name_bytes), *name_bytes,
+                                            address & 0xFF, (address >> 8) & 0xFF, size)))
         
         # Update next symbol address in header
-        self.store_int16(HEADER_NEXT_SYMBOL, ptr)
+        self.store_int16(HEADER_NEXT_SYMBOL, entry_addr + entry_size)
         return entry_addr
     
     def find_symbol(self, name: str) -> Optional[Tuple[int, int]]:
@@ -356,12 +356,8 @@ class MemoryManager:
         self.store_int16(new_line_ptr, 0)  # Will update next pointer later
         self.store_int16(new_line_ptr + 2, line_num)
         
-        # Write tokens
-        for i, byte in enumerate(tokens):
-            self.memory[new_line_ptr + 4 + i] = byte
-        
-        # Write end-of-line marker
-        self.memory[new_line_ptr + 4 + len(tokens)] = 0x0D
+        # Write tokens straight into place, end-of-line marker included
+        self.store_bytes(new_line_ptr + 4, tokens + b'\r')
         
         # Update pointers
         if prev_ptr == 0:
@@ -438,14 +434,13 @@ class MemoryManager:
             # Read line number
             line_num = self.read_int16(curr_ptr + 2)
             
-            # Read tokens until EOL
-            tokens = []
-            i = curr_ptr + 4
-            while i < self.program_top and self.memory[i] != 0x0D:
-                tokens.append(self.memory[i])
-                i += 1
+            # Read tokens until EOL, in one slice
+            start = curr_ptr + 4
+            end = self.memory.find(0x0D, start, self.program_top)
+            if end < 0:
+                end = self.program_top
             
-            lines.append((line_num, bytes(tokens)))
+            lines.append((line_num, bytes(self.memory[start:end])))
             
             # Move to next line
             next_ptr = self.read_int16(curr_ptr)
@@ -490,15 +485,11 @@ Statistics:
     # Screen memory methods
     def clear_screen(self) -> None:
         """Clear screen memory (fill with spaces)."""
-        for addr in range(SCREEN_START, SCREEN_END + 1):
-            self.memory[addr] = 0x20  # ASCII space
+        self.memory[SCREEN_START:SCREEN_END + 1] = b' ' * (SCREEN_END - SCREEN_START + 1)  # ASCII spaces
         self.screen_cursor = SCREEN_START
     
     def write_to_screen(self, text: str) -> None:
         """Write text to screen memory at cursor position."""
-        if not hasattr(self, 'screen_cursor'):
-            self.screen_cursor = SCREEN_START
-        
         # Write each character
         for char in text:
             if char == '\n':
@@ -525,28 +516,17 @@ Statistics:
     
     def scroll_screen(self) -> None:
         """Scroll screen memory up one line."""
-        # Copy lines 1-24 to lines 0-23
-        for row in range(24):
-            for col in range(40):
-                src_addr = SCREEN_START + ((row + 1) * 40) + col
-                dst_addr = SCREEN_START + (row * 40) + col
-                self.memory[dst_addr] = self.memory[src_addr]
+        # Copy lines 1-24 to lines 0-23 (one memmove)
+        last_row = SCREEN_START + (SCREEN_ROWS - 1) * SCREEN_COLS
+        self.memory[SCREEN_START:last_row] = self.memory[SCREEN_START + SCREEN_COLS:last_row + SCREEN_COLS]
         
         # Clear line 24
-        for col in range(40):
-            self.memory[SCREEN_START + (24 * 40) + col] = 0x20
+        self.memory[last_row:last_row + SCREEN_COLS] = b' ' * SCREEN_COLS
     
     def get_screen_text(self) -> str:
         """Get the current screen contents as text."""
-        lines = []
-        for row in range(25):
-            line = []
-            for col in range(40):
-                addr = SCREEN_START + (row * 40) + col
-                char_code = self.memory[addr]
-                if 32 <= char_code <= 126:
-                    line.append(chr(char_code))
-                else:
-                    line.append(' ')
-            lines.append(''.join(line).rstrip())
+        # Grab the whole screen in one slice and sanitize it in C
+        screen_end = SCREEN_START + SCREEN_ROWS * SCREEN_COLS
+        text = self.memory[SCREEN_START:screen_end].translate(SCREEN_CHARSET).decode('ascii')
+        lines = [text[i:i + SCREEN_COLS].rstrip() for i in range(0, len(text), SCREEN_COLS)]
         return '\n'.join(lines).rstrip()
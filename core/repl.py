@@ -1,25 +1,45 @@
-import re
-import subprocess
 import os
+import sys
 from typing import Optional, Any, Tuple
 
-from parser.transformer import BasicTransformer
-from parser.parser import BasicParser, exceptions
 from core.memory import MemoryManager
+from core.errors import BasicRuntimeError
+from core.tokens import tokenize_line
 from core.tokenized_program import TokenizedProgramStore
 from core.commands import CommandRegistry
 from core.token_executor import TokenExecutor
 from ncdos.disk import NCDOSDisk
 
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+
+def read_piped_line(prompt: str) -> str:
+    """
+    input() for when stdin isn't a terminal - no line editing to set up,
+    just write the prompt and read the line.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
+
 class ZenBasicRepl:
+    __slots__ = ('running', '_parser', 'turbo', 'memory_manager', 'command_registry',
+                 'token_executor', 'program_store', '_transformer', 'disk')
+    
     def __init__(self, standalone=True, disk=None):
         self.running = True
-        self.parser = BasicParser()
+        self._parser = None  # Built on first use, see _load_parser
         self.turbo = False  # RIP turbo mode, we have a co-processor now!
         self.memory_manager = MemoryManager()
-        self.program_store = TokenizedProgramStore(self.memory_manager)  # Now uses actual memory!
         self.command_registry = CommandRegistry()
         self.token_executor = TokenExecutor(self)  # Direct token execution!
+        self.program_store = TokenizedProgramStore(  # Now uses actual memory!
+            self.memory_manager, self.token_executor.compile_line)
+        self._transformer = None  # One walker, reused for every tree
         
         # Use provided disk or create new one
         if disk:
@@ -39,19 +59,50 @@ class ZenBasicRepl:
         print("Ready")
         print()
 
+    @property
+    def parser(self):
+        """The Lark parser for statements the token executor can't run"""
+        if self._parser is None:
+            self._load_parser()
+        return self._parser
+    
+    @property
+    def transformer(self):
+        """The transformer that runs the parser's trees"""
+        if self._transformer is None:
+            self._load_parser()
+        return self._transformer
+    
+    def _load_parser(self) -> None:
+        """
+        Import and build the parser and transformer. Most lines never need
+        them, and importing Lark is most of the REPL's startup time, so this
+        waits until one does.
+        """
+        from parser.parser import BasicParser
+        from parser.transformer import BasicTransformer
+        self._parser = BasicParser()
+        self._transformer = BasicTransformer(self, self.turbo)
+
     def parse_line_number(self, line: str) -> Tuple[Optional[int], str]:
         """Extract line number if present, return (line_num, remaining_code)"""
         # Don't strip! We need to check the original line for leading numbers
-        if not line.strip():
+        if not line or line.isspace():
             return None, ""
             
         # Check if line starts with a number (possibly with leading whitespace)
-        # This regex captures EVERYTHING after the digits, including precious whitespace
-        match = re.match(r'^\s*(\d+)(.*)', line)
-        if match:
-            # Return line number and EVERYTHING after it (every space, tab, whatever)
-            return int(match.group(1)), match.group(2)
-        return None, line
+        # Scan it by hand - no regex engine needed to find some digits
+        n = len(line)
+        i = 0
+        while i < n and line[i].isspace():
+            i += 1
+        j = i
+        while j < n and '0' <= line[j] <= '9':
+            j += 1
+        if j == i:
+            return None, line
+        # Return line number and EVERYTHING after it (every space, tab, whatever)
+        return int(line[i:j]), line[j:]
 
     def store_program_line(self, line_num: int, code: str):
         """Store a numbered program line (tokenized in memory now!)"""
@@ -60,21 +111,32 @@ class ZenBasicRepl:
 
     def store_variable_in_memory(self, name: str, value: Any, var_type: str) -> None:
         """Store a variable in memory using the memory manager"""
-        # Check if variable already exists
-        existing = self.memory_manager.find_symbol(name)
-        new_var = existing is None
-        
         if var_type == 'integer':
             size = 2  # 16-bit integer = 2 bytes
-            address = self.memory_manager.allocate_variable(name, size)
-            # Store the value
-            self.memory_manager.store_int16(address, int(value))
-            
         elif var_type == 'float':
             size = 4  # 32-bit float = 4 bytes
-            address = self.memory_manager.allocate_variable(name, size)
-            # Store the value
-            self.memory_manager.store_float32(address, float(value))
+        else:
+            return
+        
+        # Check if variable already exists - one symbol table walk, and
+        # only brand new variables go on to allocate
+        existing = self.memory_manager.find_symbol(name)
+        if existing is not None:
+            address, _ = existing
+        else:
+            try:
+                address = self.memory_manager.allocate_variable(name, size)
+            except MemoryError as e:
+                raise BasicRuntimeError(str(e)) from None
+        
+        # Store the value
+        try:
+            if var_type == 'integer':
+                self.memory_manager.store_int16(address, int(value))
+            else:
+                self.memory_manager.store_float32(address, float(value))
+        except (OverflowError, ValueError):
+            raise BasicRuntimeError(f"Number out of range for {name}") from None
     
     def get_variable_value(self, name: str) -> Optional[Tuple[Any, str]]:
         """Get a variable value from memory. Returns (value, type) or None."""
@@ -84,12 +146,13 @@ class ZenBasicRepl:
             
         address, size = symbol_info
         
-        # Determine type based on variable name and size
-        if name.endswith('%'):
+        # Determine type from the variable name's suffix
+        suffix = name[-1]
+        if suffix == '%':
             # Integer variable
             value = self.memory_manager.read_int16(address)
             return (value, 'integer')
-        elif name.endswith('$'):
+        elif suffix == '$':
             # String variable (not implemented yet)
             return ('', 'string')
         else:
@@ -101,19 +164,27 @@ class ZenBasicRepl:
     def execute_immediate_command(self, command: str):
         """Execute immediate mode commands (no line number)"""
         # Try command registry first
-        if not self.command_registry.execute(command, self):
-            # Not a built-in command, try to parse as BASIC statement
-            try:
+        if self.command_registry.execute(command, self):
+            return
+        
+        # Not a built-in command, run it as a BASIC statement - cleaned up
+        # the same way as a stored line, then through the token executor,
+        # same as RUN, with the parser only as a fallback
+        command = self.program_store.strip_whitespace(command)
+        try:
+            result = self.token_executor.execute_line(tokenize_line(command))
+            if result is NotImplemented:
                 tree = self.parser.parse(command)
-                transformer = BasicTransformer(self, self.turbo)
+                transformer = self.transformer
                 if self.turbo != transformer.arithmetic.turbo:
                     transformer.arithmetic.set_turbo(self.turbo)
                 result = transformer.transform(tree)
+            if result is not None:
                 print(result)
-            except exceptions.LarkError as e:
-                print(f"Syntax error: {e}")
-            except Exception as e:
-                print(f"Error: {e}")
+        except SyntaxError as e:
+            print(f"Syntax error: {e}")
+        except BasicRuntimeError as e:
+            print(f"Error: {e}")
     
 
     def list_variables(self):
@@ -123,12 +194,15 @@ class ZenBasicRepl:
             print("No variables set")
             return
             
-        print("Variables:")
-        for var_name, address, size in sorted(symbols):
+        # The symbol table is already in allocation order, so walk it as is
+        # and write the whole listing in one go
+        lines = ["Variables:"]
+        for var_name, address, size in symbols:
             var_info = self.get_variable_value(var_name)
             if var_info:
                 value, _ = var_info
-                print(f"{var_name} = {value}")
+                lines.append(f"{var_name} = {value}")
+        print('\n'.join(lines))
     
     def run_program(self):
         """Run the stored program"""
@@ -139,31 +213,38 @@ class ZenBasicRepl:
         print("Running program...")
         # Get raw tokenized lines for direct execution
         token_lines = self.memory_manager.get_program_lines()
+        bytecode = self.program_store.bytecode
+        run_bytecode = self.token_executor.run_bytecode
+        execute_line = self.token_executor.execute_line
+        parse = transform = None  # Parser fallback, set up on first use
         
         for line_num, tokens in token_lines:
             try:
-                # Try direct token execution first (fast path)
-                result = self.token_executor.execute_line(tokens)
+                code = bytecode.get(line_num)
+                if code is None:
+                    # Didn't compile when stored - this reports the syntax error
+                    result = execute_line(tokens)
+                elif code is NotImplemented:
+                    result = NotImplemented
+                else:
+                    # Compiled when the line was stored (fastest path)
+                    result = run_bytecode(code)
+                
+                if result is NotImplemented:
+                    # Token executor doesn't handle this yet, fall back to parser
+                    if transform is None:
+                        # The one transformer; sync turbo once per RUN
+                        transformer = self.transformer
+                        if self.turbo != transformer.arithmetic.turbo:
+                            transformer.arithmetic.set_turbo(self.turbo)
+                        parse, transform = self.parser.parse, transformer.transform
+                    # Parse the old way (the parser caches trees by text)
+                    result = transform(parse(self.program_store.get_line(line_num)))
+                
                 if result is not None:
                     print(result)
-            except NotImplementedError:
-                # Token executor doesn't handle this yet, fall back to parser
-                # Detokenize and parse the old way
-                from core.tokens import detokenize
-                code = detokenize(tokens)
-                
-                try:
-                    tree = self.parser.parse(code)
-                    transformer = BasicTransformer(self, self.turbo)
-                    if self.turbo != transformer.arithmetic.turbo:
-                        transformer.arithmetic.set_turbo(self.turbo)
-                    result = transformer.transform(tree)
-                    if result is not None:
-                        print(result)
-                except Exception as e:
-                    print(f"Runtime error at line {line_num}: {e}")
-                    break
-            except Exception as e:
+            except (BasicRuntimeError, SyntaxError) as e:
+                # SyntaxError: a line the compiler rejected when it was stored
                 print(f"Runtime error at line {line_num}: {e}")
                 break
     
@@ -173,10 +254,16 @@ class ZenBasicRepl:
         self.memory_manager.clear_variables()
 
     def clear_screen(self):
-        subprocess.run(['clear'] if os.name == 'posix' else ['cmd', '/c', 'cls'])
+        if os.name == 'nt' and not os.environ.get('WT_SESSION'):
+            # Legacy Windows consoles don't speak ANSI
+            import subprocess
+            subprocess.run(['cmd', '/c', 'cls'])
+        else:
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
     
     def process_line(self, line: str):
-        """Process a single line of BASIC code (used by LOAD command)"""
+        """Process a single line of BASIC code"""
         # Parse for line number
         line_num, code = self.parse_line_number(line)
         
@@ -187,20 +274,44 @@ class ZenBasicRepl:
             # Execute immediate command
             self.execute_immediate_command(code)
 
+    def process_lines(self, lines) -> int:
+        """
+        Process a batch of lines (used by LOAD). Numbered lines go straight
+        into the program store, anything else runs as an immediate command.
+        Returns the number of non-blank lines processed.
+        """
+        parse_line_number = self.parse_line_number
+        store_program_line = self.store_program_line
+        count = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            count += 1
+            line_num, code = parse_line_number(line)
+            if line_num is not None:
+                store_program_line(line_num, code)
+            else:
+                self.execute_immediate_command(code)
+        return count
+
 
     def repl(self):
         """Main Read-Eval-Print Loop"""
         self.clear_screen()
         self.print_banner()
         
+        # Keep input() at a keyboard for its line editing
+        read_line = input if sys.stdin.isatty() else read_piped_line
+        
         while self.running:
             try:
                 # Read
                 input_line = "(turbo) > " if self.turbo else "> "
-                user_input = input(input_line)
+                user_input = read_line(input_line)
                 
                 # Only check if it's empty, don't strip!
-                if not user_input.strip():
+                if not user_input or user_input.isspace():
                     continue
                 
                 # Parse for line number
@@ -5,9 +5,93 @@ Because we sold our kidneys for a math co-processor in 1983
 This executes tokenized BASIC directly from memory bytes,
 just like real 8-bit interpreters did. No parsing, no AST,
 just raw token interpretation.
+
+Well, almost. Each line is lowered once into a tiny stack bytecode
+and the bytecode is what actually runs - so a stored program only
+pays for the token scan when a line is edited, not on every RUN.
 """
-from typing import Optional, Tuple, Any
+import operator
+import re
+import sys
+from typing import Optional, Tuple, Any, List, Dict, Callable
 from core.tokens import TOKENS
+from core.errors import BasicRuntimeError
+
+# Bytecode opcodes. An instruction is an (opcode, operand) tuple.
+OP_PUSH = 0        # Push a constant
+OP_LOAD = 1        # Push a variable's value, any type (operand: name)
+OP_NEG = 2         # Negate top of stack
+OP_ADD = 3
+OP_SUB = 4
+OP_MUL = 5
+OP_DIV = 6
+OP_LET = 7         # Pop value into a variable (operand: (slot, name, var_type))
+OP_LOAD_INT = 8    # Push an integer variable straight from its address (operand: (slot, name))
+OP_LOAD_FLOAT = 9  # Push a float variable straight from its address (operand: (slot, name))
+OP_PRINT = 10      # Pop the PRINT items into one line of output (operand: separators)
+
+PRINT_ZONE = 10    # A comma in PRINT moves to the next 10-column field
+
+# Dispatch tables, filled in by the decorators below as the class is built.
+# Indexing a list beats walking an if/elif ladder for every token.
+STATEMENT_HANDLERS: List[Optional[Callable]] = [None] * 256  # Statement token -> compile method
+OP_HANDLERS: List[Optional[Callable]] = [None] * 16          # Opcode -> run method
+
+# Operator character -> opcode for binary operators
+OP_BINOP: List[Optional[int]] = [None] * 256
+OP_BINOP[0x2B] = OP_ADD  # +
+OP_BINOP[0x2D] = OP_SUB  # -
+OP_BINOP[0x2A] = OP_MUL  # *
+OP_BINOP[0x2F] = OP_DIV  # /
+
+# Binary opcode -> precedence (higher binds tighter)
+PRECEDENCE: Dict[int, int] = {
+    OP_ADD: 1,
+    OP_SUB: 1,
+    OP_MUL: 2,
+    OP_DIV: 2,
+}
+
+# Binary opcode -> the same arithmetic, for folding constants at compile time
+CONSTANT_FOLD: Dict[int, Callable[[float, float], float]] = {
+    OP_ADD: operator.add,
+    OP_SUB: operator.sub,
+    OP_MUL: operator.mul,
+    OP_DIV: operator.truediv,
+}
+
+# Any run of spaces, including none - so a match always succeeds
+_SPACES = re.compile(rb' *')
+
+# A variable name: a letter, letters, digits and underscores, then an
+# optional type suffix - the grammar's IDENTIFIER
+_VARIABLE_NAME = re.compile(rb'[A-Z][A-Z0-9_]*[%$]?')
+
+
+def skip_spaces(tokens: bytes, pos: int) -> int:
+    """Return the position of the first non-space at or after pos (one C-level scan)."""
+    return _SPACES.match(tokens, pos).end()
+
+
+def format_number(value: float) -> str:
+    """Format a number for PRINT: 42 rather than 42.0, 9 significant digits."""
+    return '%.9g' % value
+
+
+def statement(token: int):
+    """Register a method as the compiler for a statement token."""
+    def register(func):
+        STATEMENT_HANDLERS[token] = func
+        return func
+    return register
+
+
+def handles(opcode: int):
+    """Register a method as the run handler for an opcode."""
+    def register(func):
+        OP_HANDLERS[opcode] = func
+        return func
+    return register
 
 
 class TokenExecutor:
@@ -17,6 +101,9 @@ class TokenExecutor:
     we're still paying off.
     """
     
+    __slots__ = ('repl', 'memory', 'stack', 'print_column', '_slot_of', '_slots', '_generation',
+                 '_dispatch')
+    
     def __init__(self, repl):
         """
         Initialize with reference to REPL for variable/memory access.
@@ -26,6 +113,17 @@ class TokenExecutor:
         """
         self.repl = repl
         self.memory = repl.memory_manager
+        self.stack: List[Any] = []
+        self.print_column = 0  # Where a PRINT that ended in ; or , left off
+        
+        # Every variable name the compiler sees gets a slot number, and the
+        # bytecode carries the slot. Slots hold the variable's address once
+        # it's known - symbols never move once allocated, so these stay good
+        # until the symbol table is cleared.
+        self._slot_of: Dict[str, int] = {}
+        self._slots: List[Optional[int]] = []
+        self._generation = self.memory.symbol_generation
+        self._dispatch = STATEMENT_HANDLERS
         
     def execute_line(self, tokens: bytes) -> Optional[Any]:
         """
@@ -35,50 +133,71 @@ class TokenExecutor:
             tokens: Byte array of tokens for one line (without line number/pointers)
             
         Returns:
-            Result of execution (if any) or None
+            Result of execution (if any) or None, or NotImplemented if
+            we hit something we can't execute yet (fallback to parser)
+        """
+        code = self.compile_line(tokens)
+        if code is NotImplemented:
+            return NotImplemented
+        return self.run_bytecode(code)
+    
+    def compile_line(self, tokens: bytes) -> List[Tuple[int, Any]]:
+        """
+        Lower a line of tokenized BASIC to bytecode.
+        
+        Args:
+            tokens: Byte array of tokens for one line (without line number/pointers)
+            
+        Returns:
+            List of (opcode, operand) instructions (empty for a blank line),
+            or NotImplemented if the line uses something we can't lower yet
             
         Raises:
-            Exception if we hit something we can't execute yet (fallback to parser)
+            SyntaxError if the line is malformed
         """
         if not tokens:
-            return None
+            return []
             
         # Skip leading spaces
-        pos = 0
-        while pos < len(tokens) and tokens[pos] == 0x20:  # space
-            pos += 1
+        pos = skip_spaces(tokens, 0)
             
         if pos >= len(tokens):
-            return None
+            return []
             
-        # Check the first token
-        first_token = tokens[pos]
+        # Route to appropriate handler based on the first token
+        handler = self._dispatch[tokens[pos]]
+        if handler is None:
+            # We don't handle this yet, caller falls back to the parser
+            return NotImplemented
         
-        # Route to appropriate handler based on token
-        if first_token == 0xE2:  # LET
-            return self.execute_let(tokens, pos + 1)
-        elif first_token == 0xEA:  # PRINT
-            return self.execute_print(tokens, pos + 1)
-        else:
-            # We don't handle this yet, raise exception to trigger fallback
-            raise NotImplementedError(f"Token {first_token:02X} not implemented in direct executor")
+        code: List[Tuple[int, Any]] = []
+        pos = handler(self, tokens, pos + 1, code)
+        if pos is NotImplemented:
+            return NotImplemented
+        
+        # The statement has to use up the whole line
+        pos = skip_spaces(tokens, pos)
+        if pos < len(tokens):
+            raise SyntaxError(f"Unexpected {chr(tokens[pos])!r} after end of statement")
+        return code
     
-    def execute_let(self, tokens: bytes, pos: int) -> Optional[Any]:
+    @statement(0xE2)  # LET
+    def compile_let(self, tokens: bytes, pos: int, code: list) -> int:
         """
-        Execute a LET statement.
+        Compile a LET statement.
         Format: LET <var> = <expression>
         Token: E2 [spaces] <var_name> [spaces] = [spaces] <expression>
         
         Args:
             tokens: The token bytes
             pos: Position after the LET token
+            code: Bytecode list to append to
             
         Returns:
-            Result message or None
+            New position, or NotImplemented
         """
         # Skip spaces after LET
-        while pos < len(tokens) and tokens[pos] == 0x20:
-            pos += 1
+        pos = skip_spaces(tokens, pos)
             
         # Parse variable name (ASCII letters followed by optional % or $)
         var_name, pos = self.parse_variable_name(tokens, pos)
@@ -86,58 +205,82 @@ class TokenExecutor:
             raise SyntaxError("Expected variable name after LET")
             
         # Skip spaces
-        while pos < len(tokens) and tokens[pos] == 0x20:
-            pos += 1
+        pos = skip_spaces(tokens, pos)
             
         # Expect = sign
-        if pos >= len(tokens) or tokens[pos] != 0x3D:  # '='
-            raise SyntaxError(f"Expected '=' after variable name, got {tokens[pos]:02X if pos < len(tokens) else 'EOL'}")
+        if pos >= len(tokens):
+            raise SyntaxError("Expected '=' after variable name, got end of line")
+        if tokens[pos] != 0x3D:  # '='
+            raise SyntaxError(f"Expected '=' after variable name, got {chr(tokens[pos])!r}")
         pos += 1
         
         # Skip spaces after =
-        while pos < len(tokens) and tokens[pos] == 0x20:
-            pos += 1
+        pos = skip_spaces(tokens, pos)
             
-        # Evaluate the expression
-        value, pos = self.evaluate_expression(tokens, pos)
+        # Compile the expression
+        pos = self.compile_expression(tokens, pos, code)
         
         # Determine variable type
         if var_name.endswith('%'):
             # Integer variable
             var_type = 'integer'
-            value = int(value)
         elif var_name.endswith('$'):
             # String variable (not supported yet)
-            raise NotImplementedError("String variables not yet supported")
+            return NotImplemented
         else:
             # Float variable
             var_type = 'float'
-            value = float(value)
             
-        # Store the variable using REPL's method
-        self.repl.store_variable_in_memory(var_name, value, var_type)
-        
-        return f"Variable {var_name} set to {value}"
+        code.append((OP_LET, (self.slot(var_name), var_name, var_type)))
+        return pos
     
-    def execute_print(self, tokens: bytes, pos: int) -> Optional[Any]:
+    @statement(0xEA)  # PRINT
+    def compile_print(self, tokens: bytes, pos: int, code: list) -> int:
         """
-        Execute a PRINT statement.
-        For now, just a placeholder that triggers fallback.
+        Compile a PRINT statement.
+        Format: PRINT [item [; item | , item]...] [; | ,]
+        Each item is a "string" or an expression. ; runs items together,
+        , pads out to the next print zone. A trailing ; or , leaves the
+        line open, so the next PRINT carries on from there.
         
         Args:
             tokens: The token bytes
             pos: Position after PRINT token
+            code: Bytecode list to append to
             
         Returns:
-            Printed output
+            New position
         """
-        # TODO: Implement PRINT
-        raise NotImplementedError("PRINT not yet implemented in direct executor")
+        n = len(tokens)
+        separators = []  # One per item: '', ';' or ','
+        
+        pos = skip_spaces(tokens, pos)
+        while pos < n:
+            if tokens[pos] == 0x22:  # "
+                close = tokens.find(b'"', pos + 1)
+                if close < 0:
+                    raise SyntaxError("Missing closing quote")
+                code.append((OP_PUSH, tokens[pos + 1:close].decode('latin-1')))
+                pos = close + 1
+            else:
+                pos = self.compile_expression(tokens, pos, code)
+                
+            pos = skip_spaces(tokens, pos)
+            separator = ''
+            if pos < n:
+                if tokens[pos] not in (0x3B, 0x2C):  # ; ,
+                    raise SyntaxError(f"Expected ; or , in PRINT, got {chr(tokens[pos])!r}")
+                separator = chr(tokens[pos])
+                pos = skip_spaces(tokens, pos + 1)
+            separators.append(separator)
+            
+        code.append((OP_PRINT, tuple(separators)))
+        return pos
     
     def parse_variable_name(self, tokens: bytes, pos: int) -> Tuple[str, int]:
         """
         Parse a variable name from tokens.
-        Variables are ASCII: [A-Z][A-Z0-9]*[%$]?
+        Variables are ASCII: [A-Z][A-Z0-9_]*[%$]?
         
         Args:
             tokens: The token bytes
@@ -146,152 +289,138 @@ class TokenExecutor:
         Returns:
             Tuple of (variable_name, new_position)
         """
-        if pos >= len(tokens):
-            return "", pos
-            
-        # First character must be A-Z
-        if not (0x41 <= tokens[pos] <= 0x5A):  # A-Z
+        match = _VARIABLE_NAME.match(tokens, pos)
+        if match is None:
             return "", pos
-            
-        name = []
-        
-        # Collect alphanumeric characters
-        while pos < len(tokens):
-            ch = tokens[pos]
-            if 0x41 <= ch <= 0x5A:  # A-Z
-                name.append(chr(ch))
-                pos += 1
-            elif 0x30 <= ch <= 0x39:  # 0-9
-                name.append(chr(ch))
-                pos += 1
-            elif ch == 0x25:  # %
-                name.append('%')
-                pos += 1
-                break
-            elif ch == 0x24:  # $
-                name.append('$')
-                pos += 1
-                break
-            else:
-                break
-                
-        return ''.join(name), pos
+        # Interned, so every line naming A% shares one string and the
+        # slot table lookup can match it by identity
+        return sys.intern(match.group().decode('ascii')), match.end()
     
-    def evaluate_expression(self, tokens: bytes, pos: int) -> Tuple[float, int]:
+    def compile_expression(self, tokens: bytes, pos: int, code: list) -> int:
         """
-        Evaluate an expression from tokens.
+        Compile an expression from tokens.
         For now, handles:
         - Numbers (integer and float)
         - Variables
         - Binary operations (+, -, *, /)
         - Parentheses
         
-        Uses our fancy math co-processor (native Python math).
+        * and / bind tighter than + and -, same as the parser's grammar;
+        operators of equal precedence go left to right. One shunting-yard
+        pass with an operator stack - no recursion for parentheses.
         
         Args:
             tokens: The token bytes
             pos: Current position
+            code: Bytecode list to append to
             
         Returns:
-            Tuple of (computed_value, new_position)
+            New position
         """
-        # Start with parsing a term
-        left_value, pos = self.parse_term(tokens, pos)
+        n = len(tokens)
+        ops: List[Optional[int]] = []  # Pending operators, None marks an open parenthesis
+        depth = 0
         
-        # Check for operators
-        while pos < len(tokens):
-            # Skip spaces
-            while pos < len(tokens) and tokens[pos] == 0x20:
-                pos += 1
-                
-            if pos >= len(tokens):
-                break
-                
-            op = tokens[pos]
+        while True:
+            # Open parentheses, then an operand
+            pos = skip_spaces(tokens, pos)
+            while pos < n and tokens[pos] == 0x28:  # (
+                ops.append(None)
+                depth += 1
+                pos = skip_spaces(tokens, pos + 1)
+            pos = self.compile_term(tokens, pos, code)
+            
+            # Close parentheses, flushing their operators
+            pos = skip_spaces(tokens, pos)
+            while depth and pos < n and tokens[pos] == 0x29:  # )
+                opcode = ops.pop()
+                while opcode is not None:
+                    self.emit_binop(code, opcode)
+                    opcode = ops.pop()
+                depth -= 1
+                pos = skip_spaces(tokens, pos + 1)
             
             # Check if it's an operator
-            if op == 0x2B:  # +
-                pos += 1
-                right_value, pos = self.parse_term(tokens, pos)
-                left_value = left_value + right_value  # Co-processor add!
-            elif op == 0x2D:  # -
-                pos += 1
-                right_value, pos = self.parse_term(tokens, pos)
-                left_value = left_value - right_value  # Co-processor subtract!
-            elif op == 0x2A:  # *
-                pos += 1
-                right_value, pos = self.parse_term(tokens, pos)
-                left_value = left_value * right_value  # Co-processor multiply!
-            elif op == 0x2F:  # /
-                pos += 1
-                right_value, pos = self.parse_term(tokens, pos)
-                if right_value == 0:
-                    raise ValueError("Division by zero")
-                left_value = left_value / right_value  # Co-processor divide!
-            else:
+            opcode = OP_BINOP[tokens[pos]] if pos < n else None
+            if opcode is None:
                 # Not an operator we recognize, stop parsing
                 break
-                
-        return left_value, pos
+            
+            # Anything waiting that binds at least as tightly goes first
+            precedence = PRECEDENCE[opcode]
+            while ops and ops[-1] is not None and PRECEDENCE[ops[-1]] >= precedence:
+                self.emit_binop(code, ops.pop())
+            ops.append(opcode)
+            pos += 1
+            
+        if depth:
+            raise SyntaxError("Expected closing parenthesis")
+        while ops:
+            self.emit_binop(code, ops.pop())
+        return pos
+    
+    def emit_binop(self, code: list, opcode: int) -> None:
+        """Append a binary operator, folding it if both operands are constants."""
+        # Two constants on top of the stack? Do the sum now, once,
+        # instead of on every RUN. Division by zero is left for RUN
+        # to report.
+        if (code[-1][0] == OP_PUSH and code[-2][0] == OP_PUSH
+                and not (opcode == OP_DIV and code[-1][1] == 0)):
+            right_value = code.pop()[1]
+            code[-1] = (OP_PUSH, CONSTANT_FOLD[opcode](code[-1][1], right_value))
+        else:
+            code.append((opcode, None))
     
-    def parse_term(self, tokens: bytes, pos: int) -> Tuple[float, int]:
+    def compile_term(self, tokens: bytes, pos: int, code: list) -> int:
         """
-        Parse a term (number, variable, or parenthesized expression).
+        Compile a term (number or variable, optionally negated).
+        Parentheses are handled by compile_expression.
         
         Args:
             tokens: The token bytes  
             pos: Current position
+            code: Bytecode list to append to
             
         Returns:
-            Tuple of (value, new_position)
+            New position
         """
+        n = len(tokens)
+        
         # Skip leading spaces
-        while pos < len(tokens) and tokens[pos] == 0x20:
-            pos += 1
+        pos = skip_spaces(tokens, pos)
             
-        if pos >= len(tokens):
+        if pos >= n:
             raise SyntaxError("Unexpected end of expression")
             
-        # Check for parentheses
-        if tokens[pos] == 0x28:  # (
-            pos += 1
-            value, pos = self.evaluate_expression(tokens, pos)
-            # Skip spaces
-            while pos < len(tokens) and tokens[pos] == 0x20:
-                pos += 1
-            # Expect closing paren
-            if pos >= len(tokens) or tokens[pos] != 0x29:  # )
-                raise SyntaxError("Expected closing parenthesis")
-            pos += 1
-            return value, pos
-            
         # Check for negative number
         negative = False
         if tokens[pos] == 0x2D:  # -
             negative = True
             pos += 1
             # Skip spaces after minus
-            while pos < len(tokens) and tokens[pos] == 0x20:
-                pos += 1
+            pos = skip_spaces(tokens, pos)
                 
         # Try to parse a number
-        if pos < len(tokens) and (0x30 <= tokens[pos] <= 0x39):  # 0-9
+        if pos < n and (0x30 <= tokens[pos] <= 0x39):  # 0-9
             value, pos = self.parse_number(tokens, pos)
-            if negative:
-                value = -value
-            return value, pos
+            code.append((OP_PUSH, -value if negative else value))
+            return pos
             
         # Try to parse a variable
         var_name, new_pos = self.parse_variable_name(tokens, pos)
         if var_name:
-            # Look up variable value
-            var_info = self.repl.get_variable_value(var_name)
-            if var_info is None:
-                raise NameError(f"Undefined variable: {var_name}")
-            value, _ = var_info
+            # Type is fixed by the suffix, so pick the load now; the
+            # slot's address is resolved (once) when the line runs
+            suffix = var_name[-1]
+            if suffix == '%':
+                code.append((OP_LOAD_INT, (self.slot(var_name), var_name)))
+            elif suffix == '$':
+                code.append((OP_LOAD, var_name))
+            else:
+                code.append((OP_LOAD_FLOAT, (self.slot(var_name), var_name)))
             if negative:
-                value = -value
-            return float(value), new_pos
+                code.append((OP_NEG, None))
+            return new_pos
             
         raise SyntaxError(f"Expected number or variable at position {pos}")
     
@@ -306,22 +435,207 @@ class TokenExecutor:
         Returns:
             Tuple of (numeric_value, new_position)
         """
-        num_str = []
-        has_decimal = False
+        n = len(tokens)
+        start = pos
         
-        while pos < len(tokens):
+        # Integer part straight into an accumulator - no strings needed
+        value = 0
+        while pos < n:
             ch = tokens[pos]
             if 0x30 <= ch <= 0x39:  # 0-9
-                num_str.append(chr(ch))
-                pos += 1
-            elif ch == 0x2E and not has_decimal:  # . (decimal point)
-                num_str.append('.')
-                has_decimal = True
+                value = value * 10 + ch - 0x30
                 pos += 1
             else:
                 break
                 
-        if not num_str:
+        if pos < n and tokens[pos] == 0x2E:  # . (decimal point)
+            # Fractions go to float(), which reads the bytes directly
+            pos += 1
+            while pos < n and 0x30 <= tokens[pos] <= 0x39:
+                pos += 1
+            return float(tokens[start:pos]), pos
+            
+        if pos == start:
             raise SyntaxError("Expected number")
             
-        return float(''.join(num_str)), pos
+        return float(value), pos
+    
+    def run_bytecode(self, code: List[Tuple[int, Any]]) -> Optional[Any]:
+        """
+        Run a compiled line on the stack machine.
+        
+        Uses our fancy math co-processor (native Python math).
+        
+        Args:
+            code: List of (opcode, operand) instructions from compile_line
+            
+        Returns:
+            Result of execution (if any) or None
+        """
+        memory = self.memory
+        if self._generation != memory.symbol_generation:
+            # Variables were cleared, so every cached address is stale
+            self._slots = [None] * len(self._slots)
+            self._generation = memory.symbol_generation
+            
+        self.stack = stack = []
+        dispatch = OP_HANDLERS
+        pc = 0
+        end = len(code)
+        while pc < end:
+            pc = dispatch[code[pc][0]](self, code, pc)
+        return stack.pop() if stack else None
+    
+    def slot(self, var_name: str) -> int:
+        """Return the slot number for a variable name, giving it one if it's new."""
+        slot = self._slot_of.get(var_name)
+        if slot is None:
+            slot = self._slot_of[var_name] = len(self._slots)
+            self._slots.append(None)
+        return slot
+    
+    def resolve_slot(self, slot: int, var_name: str) -> Optional[int]:
+        """
+        Look up the address for a slot that doesn't have one yet.
+        
+        Returns:
+            The address, or None if the variable doesn't exist
+        """
+        symbol_info = self.memory.find_symbol(var_name)
+        if symbol_info is None:
+            return None
+        address = self._slots[slot] = symbol_info[0]
+        return address
+    
+    # Bytecode handlers. Each takes the code and pc, returns the next pc.
+    
+    @handles(OP_PUSH)
+    def _op_push(self, code: list, pc: int) -> int:
+        self.stack.append(code[pc][1])
+        return pc + 1
+    
+    @handles(OP_LOAD)
+    def _op_load(self, code: list, pc: int) -> int:
+        var_name = code[pc][1]
+        var_info = self.repl.get_variable_value(var_name)
+        if var_info is None:
+            raise BasicRuntimeError(f"Undefined variable: {var_name}")
+        value, _ = var_info
+        self.stack.append(float(value))
+        return pc + 1
+    
+    @handles(OP_LOAD_INT)
+    def _op_load_int(self, code: list, pc: int) -> int:
+        slot, var_name = code[pc][1]
+        address = self._slots[slot]
+        if address is None:
+            address = self.resolve_slot(slot, var_name)
+            if address is None:
+                raise BasicRuntimeError(f"Undefined variable: {var_name}")
+        # Stays an int: int-only arithmetic never makes a float, and mixed
+        # arithmetic comes out the same as if we'd converted it here
+        self.stack.append(self.memory.read_int16(address))
+        return pc + 1
+    
+    @handles(OP_LOAD_FLOAT)
+    def _op_load_float(self, code: list, pc: int) -> int:
+        slot, var_name = code[pc][1]
+        address = self._slots[slot]
+        if address is None:
+            address = self.resolve_slot(slot, var_name)
+            if address is None:
+                raise BasicRuntimeError(f"Undefined variable: {var_name}")
+        self.stack.append(float(self.memory.read_float32(address)))
+        return pc + 1
+    
+    @handles(OP_NEG)
+    def _op_neg(self, code: list, pc: int) -> int:
+        stack = self.stack
+        stack[-1] = -stack[-1]
+        return pc + 1
+    
+    @handles(OP_ADD)
+    def _op_add(self, code: list, pc: int) -> int:
+        stack = self.stack
+        right_value = stack.pop()
+        stack[-1] = stack[-1] + right_value  # Co-processor add!
+        return pc + 1
+    
+    @handles(OP_SUB)
+    def _op_sub(self, code: list, pc: int) -> int:
+        stack = self.stack
+        right_value = stack.pop()
+        stack[-1] = stack[-1] - right_value  # Co-processor subtract!
+        return pc + 1
+    
+    @handles(OP_MUL)
+    def _op_mul(self, code: list, pc: int) -> int:
+        stack = self.stack
+        right_value = stack.pop()
+        stack[-1] = stack[-1] * right_value  # Co-processor multiply!
+        return pc + 1
+    
+    @handles(OP_DIV)
+    def _op_div(self, code: list, pc: int) -> int:
+        stack = self.stack
+        right_value = stack.pop()
+        if right_value == 0:
+            raise BasicRuntimeError("Division by zero")
+        stack[-1] = stack[-1] / right_value  # Co-processor divide!
+        return pc + 1
+    
+    @handles(OP_PRINT)
+    def _op_print(self, code: list, pc: int) -> int:
+        separators = code[pc][1]
+        stack = self.stack
+        first = len(stack) - len(separators)
+        items = stack[first:]
+        del stack[first:]
+        
+        column = self.print_column
+        text = ''
+        for item, separator in zip(items, separators):
+            text += item if type(item) is str else format_number(item)
+            if separator == ',':
+                text += ' ' * (PRINT_ZONE - (column + len(text)) % PRINT_ZONE)
+                
+        if separators and separators[-1]:
+            # Trailing ; or , - no newline, the next PRINT carries on
+            self.print_column = column + len(text)
+        else:
+            text += '\n'
+            self.print_column = 0
+            
+        # PRINT writes its own output (there's no newline to leave to the
+        # caller), and onto the screen memory too, like the real thing
+        sys.stdout.write(text)
+        self.memory.write_to_screen(text)
+        return pc + 1
+    
+    @handles(OP_LET)
+    def _op_let(self, code: list, pc: int) -> int:
+        slot, var_name, var_type = code[pc][1]
+        value = self.stack.pop()
+        address = self._slots[slot]
+        if address is None:
+            address = self.resolve_slot(slot, var_name)
+        try:
+            if var_type == 'integer':
+                value = int(value)
+                if address is not None:
+                    self.memory.store_int16(address, value)
+            else:
+                value = float(value)
+                if address is not None:
+                    self.memory.store_float32(address, value)
+        except (OverflowError, ValueError):
+            # Infinity or NaN won't make an integer, and past 3.4e38 won't
+            # fit a 32-bit float
+            raise BasicRuntimeError(f"Number out of range for {var_name}") from None
+            
+        if address is None:
+            # New variable - let the REPL allocate it
+            self.repl.store_variable_in_memory(var_name, value, var_type)
+        
+        self.stack.append(f"Variable {var_name} set to {format_number(value)}")
+        return pc + 1
@@ -3,7 +3,8 @@ Tokenized program storage for ZenBasic
 Stores BASIC programs as tokenized bytes in actual memory
 Just like 1983!
 """
-from typing import Optional, List, Tuple
+from bisect import bisect_left, insort
+from typing import Optional, List, Tuple, Dict, Callable, Any
 from core.tokens import tokenize_line, detokenize
 from core.memory import MemoryManager
 
@@ -13,8 +14,14 @@ class TokenizedProgramStore:
     No more Python dictionaries - we're living in 64K now!
     """
     
-    def __init__(self, memory_manager):
+    def __init__(self, memory_manager, compiler: Optional[Callable[[bytes], Any]] = None):
         self.memory = memory_manager
+        # Lines are lowered to bytecode once, here, not on every RUN
+        self.compiler = compiler
+        self.bytecode: Dict[int, Any] = {}
+        # ...and detokenized once, here, not on every LIST
+        self.text: Dict[int, str] = {}
+        self.line_numbers: List[int] = []  # Kept sorted, so LIST never sorts
     
     def add_line(self, line_num: int, code: str) -> None:
         """
@@ -22,10 +29,10 @@ class TokenizedProgramStore:
         Empty code deletes the line.
         Whitespace is MURDERED. RIP formatting.
         """
-        if code.strip():
+        if code and not code.isspace():
             # Strip ALL whitespace except in strings and after REM
             # This is where your beautiful formatting dies
-            cleaned = self._strip_whitespace(code)
+            cleaned = self.strip_whitespace(code)
             
             # Tokenize the line
             tokens = tokenize_line(cleaned)
@@ -33,11 +40,40 @@ class TokenizedProgramStore:
             # Store in memory
             if not self.memory.store_program_line(line_num, tokens):
                 print(f"Out of memory! Cannot store line {line_num}")
+                # A failed replace can lose lines, so trust memory over the
+                # cached text and bytecode
+                lines = self.memory.get_program_lines()
+                self.text = {num: detokenize(toks) for num, toks in lines}
+                self.line_numbers = list(self.text)  # Memory keeps them in order
+                self.bytecode.clear()
+                for num, toks in lines:
+                    self._compile_line(num, toks)
+                return
+            if line_num not in self.text:
+                insort(self.line_numbers, line_num)
+            self.text[line_num] = detokenize(tokens)
+            self._compile_line(line_num, tokens)
         else:
             # Empty line deletes the line number
             self.memory.delete_program_line(line_num)
+            self.bytecode.pop(line_num, None)
+            self._forget_text(line_num)
     
-    def _strip_whitespace(self, code: str) -> str:
+    def _compile_line(self, line_num: int, tokens: bytes) -> None:
+        """Lower a stored line to bytecode, if the compiler can handle it."""
+        self.bytecode.pop(line_num, None)
+        if self.compiler is None:
+            return
+        try:
+            code = self.compiler(tokens)
+        except SyntaxError:
+            # Let RUN report it when it gets there
+            return
+        # NotImplemented is remembered too, so RUN sends the line straight
+        # to the parser instead of trying to compile it again every time
+        self.bytecode[line_num] = code
+    
+    def strip_whitespace(self, code: str) -> str:
         """
         Strip unnecessary whitespace while preserving strings and REM comments.
         This is where dreams of readable code go to die.
@@ -72,11 +108,12 @@ class TokenizedProgramStore:
                         result.append(' ')
             else:
                 result.append(char)
-                # Check if we just completed REM keyword
-                if len(result) >= 3:
-                    last_three = ''.join(result[-3:])
-                    if last_three.upper() == 'REM' and (len(result) == 3 or not result[-4].isalpha()):
-                        in_rem = True
+                # Check if we just completed REM keyword - only an M can do
+                # that, so everything else skips the check
+                if (char in 'Mm' and len(result) >= 3
+                        and result[-2] in 'Ee' and result[-3] in 'Rr'
+                        and (len(result) == 3 or not result[-4].isalpha())):
+                    in_rem = True
             
             i += 1
         
@@ -84,20 +121,23 @@ class TokenizedProgramStore:
     
     def delete_line(self, line_num: int) -> bool:
         """Delete a specific line number."""
+        self.bytecode.pop(line_num, None)
+        self._forget_text(line_num)
         return self.memory.delete_program_line(line_num)
     
+    def _forget_text(self, line_num: int) -> None:
+        """Drop a line's cached text and its place in the line order."""
+        if self.text.pop(line_num, None) is not None:
+            del self.line_numbers[bisect_left(self.line_numbers, line_num)]
+    
     def get_line(self, line_num: int) -> Optional[str]:
         """Get the detokenized code for a specific line number."""
-        lines = self.memory.get_program_lines()
-        for num, tokens in lines:
-            if num == line_num:
-                return detokenize(tokens)
-        return None
+        return self.text.get(line_num)
     
     def get_all_lines(self) -> List[Tuple[int, str]]:
         """Get all lines detokenized and sorted by line number."""
-        lines = self.memory.get_program_lines()
-        return [(num, detokenize(tokens)) for num, tokens in lines]
+        text = self.text
+        return [(num, text[num]) for num in self.line_numbers]
     
     def list_program(self) -> None:
         """Display the current program with formatted line numbers."""
@@ -106,12 +146,14 @@ class TokenizedProgramStore:
             print("No program in memory")
             return
         
-        for line_num, code in lines:
-            print(f"{line_num:5d} {code}")
+        print('\n'.join([f"{line_num:5d} {code}" for line_num, code in lines]))
     
     def clear_program(self) -> None:
         """Clear all program lines."""
         self.memory.clear_program()
+        self.bytecode.clear()
+        self.text.clear()
+        self.line_numbers.clear()
     
     def save_to_file(self, filename: str) -> None:
         """
@@ -123,8 +165,7 @@ class TokenizedProgramStore:
         try:
             lines = self.get_all_lines()
             with open(filename, 'w') as f:
-                for line_num, code in lines:
-                    f.write(f"{line_num} {code}\n")
+                f.write(''.join([f"{line_num} {code}\n" for line_num, code in lines]))
             print(f"Program saved to {filename}")
         except IOError as e:
             print(f"Error saving file: {e}")
@@ -136,7 +177,7 @@ class TokenizedProgramStore:
     
     def __len__(self) -> int:
         """Return the number of lines in the program."""
-        return len(self.memory.get_program_lines())
+        return len(self.text)
     
     def __bool__(self) -> bool:
         """Return True if program has any lines."""
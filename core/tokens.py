@@ -5,6 +5,8 @@ Because Sophie Wilson and team knew what they were doing in 1981
 Token values from 0x80-0xFF are used for keywords
 0x00-0x7F remain as regular ASCII characters
 """
+import re
+import string
 
 # BBC BASIC Token Map - straight from the BBC Micro manual
 TOKENS = {
@@ -184,51 +186,61 @@ KEYWORDS_TO_TOKENS.update(ZENBASIC_TOKENS)
 # Handle CLEAR properly - it clears variables (0xD1), not screen
 # CLS clears the screen (0xD4)
 
+# Every keyword in one regex alternation, plus the quote that starts a
+# string. Longest keywords go first, so the first alternative that matches
+# at a position is the longest keyword there - and a single search() call
+# skips straight over all the plain text in between.
+MAX_KEYWORD_LENGTH = 8
+_KEYWORD_OR_QUOTE = re.compile('|'.join(
+    ['"'] + [re.escape(keyword)
+             for keyword in sorted(KEYWORDS_TO_TOKENS, key=len, reverse=True)
+             if len(keyword) <= MAX_KEYWORD_LENGTH]))
+
+# Byte -> its text, already encoded: ASCII stands for itself, tokens are
+# their keyword and unknown tokens show up as <XX>. Detokenizing is then
+# one lookup per byte and a single decode at the end.
+_DETOK = tuple(
+    bytes([byte]) if byte < 0x80 else TOKENS.get(byte, f"<{byte:02X}>").encode('ascii')
+    for byte in range(256))
+
+# Uppercase ASCII letters only - BASIC keywords are ASCII
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
 def tokenize_line(line: str) -> bytes:
     """
     Tokenize a BASIC line, converting keywords to their token bytes.
     Preserves strings and handles special cases.
     """
-    result = []
+    result = bytearray()
     i = 0
-    in_string = False
-    in_rem = False
+    n = len(line)
+    upper = line.translate(_ASCII_UPPER)  # Keywords match in any case
+    search = _KEYWORD_OR_QUOTE.search
     
-    while i < len(line):
-        if in_string:
-            # Inside a string, keep everything as-is
-            if line[i] == '"':
-                in_string = False
-            result.append(ord(line[i]))
-            i += 1
-        elif in_rem:
-            # After REM, keep everything as-is
-            result.append(ord(line[i]))
-            i += 1
+    while i < n:
+        match = search(upper, i)
+        if match is None:
+            # No more keywords, keep the rest as-is
+            result += line[i:].encode('latin-1')
+            break
+            
+        start, end = match.span()
+        # Everything before the match isn't a keyword, keep it
+        result += line[i:start].encode('latin-1')
+        word = match.group()
+        
+        if word == '"':
+            # Inside a string, keep everything as-is (closing quote too)
+            close = line.find('"', end)
+            end = n if close < 0 else close + 1
+            result += line[start:end].encode('latin-1')
         else:
-            # Check for string start
-            if line[i] == '"':
-                in_string = True
-                result.append(ord('"'))
-                i += 1
-            # Check for keywords
-            else:
-                found_keyword = False
-                # Try to match keywords, longest first
-                for length in range(min(8, len(line) - i), 0, -1):
-                    word = line[i:i+length].upper()
-                    if word in KEYWORDS_TO_TOKENS:
-                        result.append(KEYWORDS_TO_TOKENS[word])
-                        if word == "REM":
-                            in_rem = True
-                        i += length
-                        found_keyword = True
-                        break
-                
-                if not found_keyword:
-                    # Not a keyword, keep the character
-                    result.append(ord(line[i]))
-                    i += 1
+            result.append(KEYWORDS_TO_TOKENS[word])
+            if word == "REM":
+                # After REM, keep everything as-is
+                result += line[end:].encode('latin-1')
+                break
+        i = end
     
     return bytes(result)
 
@@ -236,28 +248,5 @@ def detokenize(tokens: bytes) -> str:
     """
     Convert tokenized bytes back to BASIC text.
     """
-    result = []
-    i = 0
-    in_string = False
-    in_rem = False
-    
-    while i < len(tokens):
-        byte = tokens[i]
-        
-        if byte >= 0x80:
-            # It's a token
-            keyword = TOKENS.get(byte, f"<{byte:02X}>")
-            result.append(keyword)
-            if keyword == "REM":
-                in_rem = True
-        elif byte == ord('"'):
-            # Quote toggles string mode
-            in_string = not in_string
-            result.append('"')
-        else:
-            # Regular ASCII character
-            result.append(chr(byte))
-        
-        i += 1
-    
-    return ''.join(result)
+    table = _DETOK
+    return b''.join([table[byte] for byte in tokens]).decode('ascii')
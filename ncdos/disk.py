@@ -58,6 +58,7 @@ class NCDOSDisk:
         self.filename = filename
         self.disk = bytearray(DISK_SIZE)
         self.mounted = False
+        self._catalog_cache: Optional[List[Tuple[str, int]]] = None  # list_files() result
         
         # Try to load existing disk
         if os.path.exists(filename):
@@ -75,6 +76,7 @@ class NCDOSDisk:
         """
         # Clear entire disk
         self.disk = bytearray(DISK_SIZE)
+        self._catalog_cache = None
         
         # Write boot sector signature
         self._write_sector(0, 0, b'NCDOS1.0' + b'\x00' * 248)
@@ -158,6 +160,7 @@ class NCDOSDisk:
         
         # Check if file exists and delete it
         self.delete_file(filename)
+        self._catalog_cache = None
         
         # Find free directory entry
         dir_entry_addr = self._find_free_dir_entry()
@@ -260,6 +263,7 @@ class NCDOSDisk:
         # Mark directory entry as deleted (set bit 7 of attributes)
         sector_data[offset + 11] |= 0x80
         self._write_sector(track, sector, bytes(sector_data))
+        self._catalog_cache = None
         
         # Free sectors in FAT
         self._free_fat_chain(file_track, file_sector)
@@ -274,6 +278,11 @@ class NCDOSDisk:
         Returns:
             List of (filename, size) tuples
         """
+        # The directory only changes through save/delete/format/load,
+        # which all drop the cached catalog
+        if self._catalog_cache is not None:
+            return list(self._catalog_cache)
+        
         files = []
         
         # Scan directory
@@ -294,7 +303,8 @@ class NCDOSDisk:
                         
                     files.append((filename, size))
                     
-        return files
+        self._catalog_cache = files
+        return list(files)
         
     def _write_sector(self, track: int, sector: int, data: bytes):
         """Write data to a sector."""
@@ -431,11 +441,18 @@ class NCDOSDisk:
         
     def save_disk(self):
         """Save disk image to file."""
+        # Buffered, so write() keeps going until the whole image is out
         with open(self.filename, 'wb') as f:
             f.write(self.disk)
             
     def load_disk(self):
         """Load disk image from file."""
+        # Read the image straight into the disk buffer, no intermediate
+        # bytes copy
+        self.disk = bytearray(DISK_SIZE)
+        self._catalog_cache = None
         with open(self.filename, 'rb') as f:
-            self.disk = bytearray(f.read(DISK_SIZE))
+            size = f.readinto(self.disk)
+        if size != DISK_SIZE:
+            raise IOError(f"Disk image {self.filename} is {size} bytes, expected {DISK_SIZE}")
         self.mounted = True
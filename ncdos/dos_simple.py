@@ -4,9 +4,32 @@ Direct to DOS prompt like MS-DOS/CP/M
 """
 
 import os
-from typing import Optional, Dict, List, Callable
+import sys
+from typing import Optional, Dict
 from ncdos.disk import NCDOSDisk
 
+# Erase display + cursor home. No need to fork a shell just to run clear.
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# DOS command word -> handler method. Fixed vocabulary, built once at import.
+COMMANDS: Dict[str, str] = {
+    'DIR': 'cmd_dir',
+    'CAT': 'cmd_dir',
+    'TYPE': 'cmd_type',
+    'DEL': 'cmd_delete',
+    'DELETE': 'cmd_delete',
+    'COPY': 'cmd_copy',
+    'REN': 'cmd_rename',
+    'RENAME': 'cmd_rename',
+    'CLS': 'cmd_cls',
+    'CLEAR': 'cmd_cls',
+    'BASIC': 'cmd_basic',
+    'EDIT': 'cmd_edit',
+    'HELP': 'cmd_help',
+    'EXIT': 'cmd_exit',
+    'QUIT': 'cmd_exit',
+}
+
 
 class NCDOSSimple:
     """
@@ -19,32 +42,20 @@ class NCDOSSimple:
         self.disk = NCDOSDisk(os.path.join(os.path.dirname(__file__), "ncdos.dsk"))
         self.current_drive = 'A'
         self.running = True
-        self.commands = self._register_commands()
-        
-    def _register_commands(self) -> Dict[str, Callable]:
-        """Register DOS command handlers."""
-        return {
-            'DIR': self.cmd_dir,
-            'CAT': self.cmd_dir,
-            'TYPE': self.cmd_type,
-            'DEL': self.cmd_delete,
-            'DELETE': self.cmd_delete,
-            'COPY': self.cmd_copy,
-            'REN': self.cmd_rename,
-            'RENAME': self.cmd_rename,
-            'CLS': self.cmd_cls,
-            'CLEAR': self.cmd_cls,
-            'BASIC': self.cmd_basic,
-            'EDIT': self.cmd_edit,
-            'HELP': self.cmd_help,
-            'EXIT': self.cmd_exit,
-            'QUIT': self.cmd_exit,
-        }
+        
+    def _clear_screen(self):
+        """Clear the terminal."""
+        if os.name == 'nt' and not os.environ.get('WT_SESSION'):
+            # Legacy Windows consoles don't speak ANSI
+            os.system('cls')
+        else:
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
     
     def boot(self):
         """Boot NCDOS and start command prompt."""
         # Clear screen on boot for clean start
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self._clear_screen()
         
         print("NCDOS 1.0 - NinthCircle DOS")
         print("64K RAM System, 160KB Disk")
@@ -61,18 +72,17 @@ class NCDOSSimple:
                 if not command_line:
                     continue
                 
-                # Parse command
-                parts = command_line.upper().split()
-                if not parts:
-                    continue
-                
-                cmd = parts[0]
-                args = parts[1:] if len(parts) > 1 else []
+                # Parse command - only the command word gets uppercased,
+                # the argument tail is left for the handler to split
+                parts = command_line.split(None, 1)
+                cmd = parts[0].upper()
+                tail = parts[1] if len(parts) > 1 else ''
                 
                 # Execute command
-                if cmd in self.commands:
+                handler = COMMANDS.get(cmd)
+                if handler:
                     try:
-                        self.commands[cmd](args)
+                        getattr(self, handler)(tail)
                     except Exception as e:
                         print(f"Error: {e}")
                 else:
@@ -82,7 +92,7 @@ class NCDOSSimple:
                 print()
                 break
     
-    def cmd_dir(self, args: List[str]):
+    def cmd_dir(self, args: str):
         """DIR/CAT - List directory."""
         files = self.disk.list_files()
         
@@ -106,13 +116,14 @@ class NCDOSSimple:
         free = (40 * 16 * 256) - total_size - (16 * 256)
         print(f"{free} bytes free")
     
-    def cmd_type(self, args: List[str]):
+    def cmd_type(self, args: str):
         """TYPE - Display file contents."""
-        if not args:
+        parts = args.split()
+        if not parts:
             print("Syntax: TYPE filename")
             return
         
-        filename = args[0]
+        filename = parts[0]
         if '.' not in filename:
             filename += '.TXT'
         
@@ -129,13 +140,14 @@ class NCDOSSimple:
         except:
             print("File is not a text file")
     
-    def cmd_delete(self, args: List[str]):
+    def cmd_delete(self, args: str):
         """DEL/DELETE - Delete file."""
-        if not args:
+        parts = args.split()
+        if not parts:
             print("Syntax: DEL filename")
             return
         
-        filename = args[0]
+        filename = parts[0]
         if '.' not in filename:
             filename += '.TXT'
         
@@ -144,14 +156,15 @@ class NCDOSSimple:
         else:
             print(f"File not found: {filename}")
     
-    def cmd_copy(self, args: List[str]):
+    def cmd_copy(self, args: str):
         """COPY - Copy file."""
-        if len(args) < 2:
+        parts = args.split()
+        if len(parts) < 2:
             print("Syntax: COPY source dest")
             return
         
-        source = args[0]
-        dest = args[1]
+        source = parts[0]
+        dest = parts[1]
         
         data = self.disk.load_file(source)
         if data is None:
@@ -163,14 +176,15 @@ class NCDOSSimple:
         else:
             print("Error copying file")
     
-    def cmd_rename(self, args: List[str]):
+    def cmd_rename(self, args: str):
         """REN/RENAME - Rename file."""
-        if len(args) < 2:
+        parts = args.split()
+        if len(parts) < 2:
             print("Syntax: REN oldname newname")
             return
         
-        old_name = args[0]
-        new_name = args[1]
+        old_name = parts[0]
+        new_name = parts[1]
         
         data = self.disk.load_file(old_name)
         if data is None:
@@ -184,11 +198,11 @@ class NCDOSSimple:
         else:
             print("Error renaming file")
     
-    def cmd_cls(self, args: List[str]):
+    def cmd_cls(self, args: str):
         """CLS/CLEAR - Clear screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self._clear_screen()
     
-    def cmd_basic(self, args: List[str]):
+    def cmd_basic(self, args: str):
         """BASIC - Load BASIC ROM."""
         print("Loading BASIC ROM...")
         
@@ -197,7 +211,7 @@ class NCDOSSimple:
         time.sleep(0.5)
         
         # Clear screen for BASIC
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self._clear_screen()
         
         # Launch BASIC interpreter with shared disk
         from core.repl import ZenBasicRepl
@@ -205,13 +219,14 @@ class NCDOSSimple:
         basic.repl()
         
         # Clear screen when returning to DOS
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self._clear_screen()
         print("Returned to NCDOS")
         print()
     
-    def cmd_edit(self, args: List[str]):
+    def cmd_edit(self, args: str):
         """EDIT - Load editor ROM."""
-        filename = args[0] if args else None
+        parts = args.split()
+        filename = parts[0] if parts else None
         
         if filename:
             print(f"Loading EDITOR ROM with {filename}...")
@@ -220,7 +235,7 @@ class NCDOSSimple:
         
         print("EDITOR not yet implemented")
     
-    def cmd_help(self, args: List[str]):
+    def cmd_help(self, args: str):
         """HELP - Show available commands."""
         print("\nNCDOS Commands:")
         print()
@@ -236,7 +251,7 @@ class NCDOSSimple:
         print("  EXIT            - Exit NCDOS")
         print()
     
-    def cmd_exit(self, args: List[str]):
+    def cmd_exit(self, args: str):
         """EXIT/QUIT - Exit NCDOS."""
         print("Goodbye from the Ninth Circle!")
         self.running = False
@@ -9,6 +9,8 @@ class AuthenticArithmetic:
     Supports turbo mode for when you need 1000 + 1000 to finish before lunch.
     """
     
+    __slots__ = ('turbo',)
+    
     def __init__(self, turbo: bool = False):
         self.turbo = turbo
     
@@ -92,11 +94,15 @@ class AuthenticArithmetic:
         negative_result = (a < 0) ^ (b < 0)
         a, b = abs(a), abs(b)
         
-        # Count how many times b fits into a
-        count = 0
-        while a >= b:
-            a = self.sub_by_loop(a, b)
-            count += 1
+        if b & (b - 1) == 0:
+            # Power of two: even a 6502 knows that's just a shift right
+            count = a >> (b.bit_length() - 1)
+        else:
+            # Count how many times b fits into a
+            count = 0
+            while a >= b:
+                a = self.sub_by_loop(a, b)
+                count += 1
         
         return -count if negative_result else count
     
@@ -118,8 +124,12 @@ class AuthenticArithmetic:
         b_orig = b
         a, b = abs(a), abs(b)
         
-        while a >= b:
-            a = self.sub_by_loop(a, b)
+        if b & (b - 1) == 0:
+            # Power of two: the remainder is just the low bits
+            a &= b - 1
+        else:
+            while a >= b:
+                a = self.sub_by_loop(a, b)
         
         # Handle negative numbers properly for modulo
         if a_orig < 0:
@@ -5,7 +5,13 @@ Handles grammar loading and parser creation
 from pathlib import Path
 from lark import Lark, Transformer, Token, exceptions
 from lark.exceptions import LarkError
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+
+try:
+    # Optional: Lark's Cython lexer/parser. Pure-Python Lark works too, slower.
+    import lark_cython
+except ImportError:
+    lark_cython = None
 
 
 class BasicParser:
@@ -14,7 +20,7 @@ class BasicParser:
     Loads grammar from file and provides parsing functionality.
     """
     
-    def __init__(self, grammar_file: str = "basic.lark"):
+    def __init__(self, grammar_file: str = "basic.lark", cache_size: int = 256):
         """Initialize parser with grammar from file"""
         grammar_path = Path(__file__).parent / grammar_file
         
@@ -24,11 +30,34 @@ class BasicParser:
         with open(grammar_path, 'r') as f:
             grammar_content = f.read()
         
-        self.parser = Lark(grammar_content, parser='lalr', debug=False)
+        # cache=True keeps the LALR tables in the temp dir, keyed by a hash of
+        # the grammar, so later startups skip the grammar analysis
+        plugins = lark_cython.plugins if lark_cython is not None else {}
+        self.parser = Lark(grammar_content, parser='lalr', debug=False, cache=True,
+                           _plugins=plugins)
+        
+        # Parse trees memoized by source text. The grammar is fixed for the
+        # life of this parser, and transformers never mutate the tree, so
+        # the same statement typed or RUN twice only gets parsed once.
+        self.cache_size = cache_size
+        self._tree_cache: Dict[str, Any] = {}
     
     def parse(self, text: str):
-        """Parse BASIC code and return parse tree"""
-        return self.parser.parse(text)
+        """
+        Parse BASIC code and return parse tree.
+        Raises SyntaxError (with Lark's message) if the code doesn't parse.
+        """
+        tree = self._tree_cache.get(text)
+        if tree is None:
+            try:
+                tree = self.parser.parse(text)
+            except LarkError as e:
+                raise SyntaxError(str(e)) from e
+            if len(self._tree_cache) >= self.cache_size:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._tree_cache[next(iter(self._tree_cache))]
+            self._tree_cache[text] = tree
+        return tree
     
     def parse_safe(self, text: str) -> tuple[bool, Any]:
         """
@@ -38,7 +67,7 @@ class BasicParser:
         try:
             tree = self.parse(text)
             return True, tree
-        except exceptions.LarkError as e:
+        except SyntaxError as e:
             return False, f"Syntax error: {e}"
         except Exception as e:
             return False, f"Error: {e}"
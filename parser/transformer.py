@@ -1,33 +1,84 @@
 from __future__ import annotations
+import operator
 from lark import Transformer, Token
-from typing import Dict, Any, List, Tuple, Union, TYPE_CHECKING
+from lark.exceptions import VisitError
+from typing import Dict, Any, List, Union, Callable, TYPE_CHECKING
 
 from parser.arithmetic import AuthenticArithmetic
+from core.errors import BasicRuntimeError
+from core.token_executor import format_number
 
 if TYPE_CHECKING:
     from core.repl import ZenBasicRepl
 
+
+class IntVal:
+    """An integer value in an expression (the ALU's problem)"""
+    __slots__ = ('value',)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+class FloatVal:
+    """A float value in an expression (the co-processor's problem)"""
+    __slots__ = ('value',)
+
+    def __init__(self, value: float):
+        self.value = value
+
+
+# Expression values carry their type in their class, not a string tag,
+# so each operator is one type-identity check away from the right math
+Value = Union[IntVal, FloatVal]
+
+
+def _make_binop(int_op: Callable, float_op: Callable, checks_zero: bool = False):
+    """
+    Build an arithmetic rule. Two integers go through the ALU (int_op is an
+    AuthenticArithmetic method); anything else is co-processor math, where
+    Python already promotes the int side of a mixed pair.
+    """
+    def binop(self, items: List[Any]) -> Value:
+        left, right = items
+
+        if checks_zero and right.value == 0:
+            raise BasicRuntimeError("Division by zero")
+
+        if type(left) is IntVal and type(right) is IntVal:
+            return IntVal(int_op(self.arithmetic, left.value, right.value))
+        else:
+            return FloatVal(float_op(left.value, right.value))
+    return binop
+
+
 class BasicTransformer(Transformer[Any, Any]):
     def __init__(self, repl_instance=None, turbo: bool = False):
         self.repl_instance = repl_instance
         self.turbo = turbo
         self.arithmetic = AuthenticArithmetic(turbo)
 
+    def transform(self, tree: Any) -> Any:
+        # Lark wraps anything a callback raises in a VisitError; hand BASIC
+        # runtime errors back as themselves so callers can catch them by type,
+        # and anything else as a runtime error so callers needn't know Lark
+        try:
+            return super().transform(tree)
+        except VisitError as e:
+            if isinstance(e.orig_exc, BasicRuntimeError):
+                raise e.orig_exc from None
+            raise BasicRuntimeError(str(e)) from e
+
     def let_statement(self, items: List[Any]) -> str:
         var_name = str(items[0])          
-        expression_result = items[1]        
-
-        if isinstance(expression_result, tuple):
-            value = expression_result[0] # type: ignore
-        else:
-            value = expression_result
+        value = items[1].value
     
         self.set_variable(var_name, value)
-        return f"Variable {var_name} set to {value}"
+        return f"Variable {var_name} set to {format_number(value)}"
 
     def set_variable(self, name: str, value: Any):
         if not self.repl_instance:
-            raise RuntimeError("No REPL instance available")
+            raise BasicRuntimeError("No REPL instance available")
             
         if name.endswith('%'):
             self.repl_instance.store_variable_in_memory(name, int(value), 'integer')
@@ -37,82 +88,44 @@ class BasicTransformer(Transformer[Any, Any]):
         else:
             self.repl_instance.store_variable_in_memory(name, float(value), 'float')
 
-    def get_variable(self, name: str):
+    def get_variable(self, name: str) -> Value:
         if not self.repl_instance:
-            raise RuntimeError("No REPL instance available")
+            raise BasicRuntimeError("No REPL instance available")
             
         var_info = self.repl_instance.get_variable_value(name)
         if var_info:
-            return var_info
+            value, var_type = var_info
+            return IntVal(value) if var_type == 'integer' else FloatVal(value)
         else:
             # Variable not found, return default
-            return (0, 'float')
-
-    def add(self, items: List[Any]) -> Tuple[Union[int, float], str]:
-        left_val, left_type = items[0]
-        right_val, right_type = items[1]
-
-        if left_type == 'integer' and right_type == 'integer':
-            result = self.arithmetic.add_by_loop(left_val, right_val)
-            return (result, 'integer')
-        else:
-            result = float(left_val) + float(right_val)
-            return (result, 'float')
-
-    def sub(self, items: List[Any]) -> Tuple[Union[int, float], str]:
-        left_val, left_type = items[0]
-        right_val, right_type = items[1]
-
-        if left_type == 'integer' and right_type == 'integer':
-            result = self.arithmetic.sub_by_loop(left_val, right_val)
-            return (result, 'integer')
+            return FloatVal(0.0)
+
+    # The four arithmetic rules share one body, see _make_binop
+    add = _make_binop(AuthenticArithmetic.add_by_loop, operator.add)
+    sub = _make_binop(AuthenticArithmetic.sub_by_loop, operator.sub)
+    mul = _make_binop(AuthenticArithmetic.multiply_by_addition, operator.mul)
+    div = _make_binop(AuthenticArithmetic.div_by_loop, operator.truediv, checks_zero=True)
+
+    def factor(self, items: List[Any]) -> Value:
+        item: Union[Value, str] = items[0]
+        if type(item) is str:
+            return self.get_variable(item)
         else:
-            result = float(left_val) - float(right_val)
-            return (result, 'float')
-
-    def mul(self, items: List[Any]) -> Tuple[Union[int, float], str]:
-        left_val, left_type = items[0]
-        right_val, right_type = items[1]
-
-        if left_type == 'integer' and right_type == 'integer':
-            result = self.arithmetic.multiply_by_addition(left_val, right_val)
-            return (result, 'integer')
-        else:
-            result = float(left_val) * float(right_val)
-            return (result, 'float')
-
-    def div(self, items: List[Any]) -> Tuple[Union[int, float], str]:
-        left_val, left_type = items[0]
-        right_val, right_type = items[1]
-
-        if left_type == 'integer' and right_type == 'integer':
-            result = self.arithmetic.div_by_loop(left_val, right_val)
-            return (result, 'integer')
-        else:
-            result = float(left_val) / float(right_val)
-            return (result, 'float')
-
-
-    def factor(self, items: List[Any]) -> Tuple[Union[int, float], str]:
-        item: Union[Tuple[Union[int, float], str], str] = items[0]
-        if isinstance(item, tuple):
             return item
-        else:
-            var_name = str(item)
-            return self.get_variable(var_name)
 
-    def expression(self, items: List[Any]) -> int:
+    def expression(self, items: List[Any]) -> Value:
         return items[0]
 
-    def term(self, items: List[Any]) -> int:
+    def term(self, items: List[Any]) -> Value:
         return items[0]
 
+    # .value rather than str(): lark_cython's tokens aren't str subclasses
     def IDENTIFIER(self, token: Token) -> str:
-        return str(token)
+        return token.value
     
-    def NUMBER(self, token: Token) -> Tuple[Any, str]:
-        value_str = str(token)
+    def NUMBER(self, token: Token) -> Value:
+        value_str = token.value
         if '.' in value_str:
-            return float(value_str), 'float'
+            return FloatVal(float(value_str))
         else:
-            return int(value_str), 'integer'
+            return IntVal(int(value_str))
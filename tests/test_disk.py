@@ -5,8 +5,10 @@ Test the NCDOS disk SAVE/LOAD functionality
 
 import os
 import sys
+import tempfile
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.repl import ZenBasicRepl
+from ncdos.disk import NCDOSDisk
 
 def test_save_load():
     """Test saving and loading BASIC programs to NCDOS disk"""
@@ -70,6 +72,55 @@ def test_save_load():
     print("\n" + "=" * 40)
     print("NCDOS disk test complete!")
 
+def test_catalog_cache():
+    """The cached catalog follows saves and deletes"""
+    disk = NCDOSDisk(os.path.join(tempfile.mkdtemp(), "test.dsk"))
+    assert disk.list_files() == []
+    
+    disk.save_file("ONE.BAS", b"10 A = 1\n")
+    disk.save_file("TWO.BAS", b"10 B = 2\n")
+    assert disk.list_files() == [("ONE.BAS", 9), ("TWO.BAS", 9)]
+    
+    # Callers get their own copy
+    disk.list_files().clear()
+    assert len(disk.list_files()) == 2
+    
+    disk.delete_file("ONE.BAS")
+    assert disk.list_files() == [("TWO.BAS", 9)]
+    
+    disk.format_disk()
+    assert disk.list_files() == []
+
+def test_disk_image_round_trip():
+    """The whole image is written and read back; a short one is refused"""
+    filename = os.path.join(tempfile.mkdtemp(), "test.dsk")
+    disk = NCDOSDisk(filename)
+    disk.save_file("ONE.BAS", b"10 A = 1\n")
+    assert NCDOSDisk(filename).disk == disk.disk
+    
+    with open(filename, 'r+b') as f:
+        f.truncate(1000)
+    try:
+        NCDOSDisk(filename)
+    except IOError:
+        pass
+    else:
+        assert False, "truncated disk image was mounted"
+
+def test_load_keeps_malformed_lines():
+    """LOAD stores every line, even ones that won't run"""
+    disk = NCDOSDisk(os.path.join(tempfile.mkdtemp(), "test.dsk"))
+    disk.save_file("P.BAS", b"10 LET A = 1\n20 LET B\n30 LET = 3\n40 LET D = 4\n")
+    repl = ZenBasicRepl(standalone=False, disk=disk)
+    
+    repl.command_registry.execute("LOAD P", repl)
+    assert [num for num, _ in repl.program_store.get_all_lines()] == [10, 20, 30, 40]
+    
+    # RUN gets as far as the bad line and reports it there
+    repl.run_program()
+    assert repl.get_variable_value("A") == (1.0, "float")
+    assert repl.get_variable_value("D") is None
+
 if __name__ == "__main__":
     # Remove old disk file if it exists
     if os.path.exists("ncdos.dsk"):
@@ -77,3 +128,6 @@ if __name__ == "__main__":
         os.remove("ncdos.dsk")
     
     test_save_load()
+    test_catalog_cache()
+    test_disk_image_round_trip()
+    test_load_keeps_malformed_lines()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Test the direct token executor and its bytecode
+"""
+
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.repl import ZenBasicRepl
+from core.tokens import tokenize_line
+from core.token_executor import OP_PUSH, OP_LOAD_FLOAT, OP_ADD, OP_DIV, OP_LET, OP_PRINT
+from core.errors import BasicRuntimeError
+from ncdos.disk import NCDOSDisk
+
+
+def make_repl():
+    """Create a REPL on a scratch disk so tests never touch ncdos.dsk"""
+    disk = NCDOSDisk(os.path.join(tempfile.mkdtemp(), "test.dsk"))
+    return ZenBasicRepl(standalone=False, disk=disk)
+
+
+def test_compile_let():
+    """LET lowers to push/load/op/store bytecode"""
+    repl = make_repl()
+    slot = repl.token_executor.slot
+    code = repl.token_executor.compile_line(tokenize_line("LET A = B + 2"))
+    assert code == [(OP_LOAD_FLOAT, (slot("B"), "B")), (OP_PUSH, 2.0), (OP_ADD, None),
+                    (OP_LET, (slot("A"), "A", "float"))]
+    assert slot("B") != slot("A")
+
+
+def test_constant_folding():
+    """Constant subexpressions are worked out at compile time"""
+    repl = make_repl()
+    compile_line = repl.token_executor.compile_line
+    a, b = repl.token_executor.slot("A"), repl.token_executor.slot("B")
+    assert compile_line(tokenize_line("LET A% = 3 * 4 + 1")) == [
+        (OP_PUSH, 13.0), (OP_LET, (repl.token_executor.slot("A%"), "A%", "integer"))]
+    assert compile_line(tokenize_line("LET A = B + (2 * 3)")) == [
+        (OP_LOAD_FLOAT, (b, "B")), (OP_PUSH, 6.0), (OP_ADD, None), (OP_LET, (a, "A", "float"))]
+
+    # Precedence puts 2 * 3 together, so it folds even after a variable
+    assert compile_line(tokenize_line("LET A = B + 2 * 3")) == [
+        (OP_LOAD_FLOAT, (b, "B")), (OP_PUSH, 6.0), (OP_ADD, None), (OP_LET, (a, "A", "float"))]
+
+    # Division by zero waits for RUN
+    assert compile_line(tokenize_line("LET A = 1 / 0")) == [
+        (OP_PUSH, 1.0), (OP_PUSH, 0.0), (OP_DIV, None), (OP_LET, (a, "A", "float"))]
+
+
+def test_operator_precedence():
+    """* and / bind tighter than + and -, and parentheses win"""
+    repl = make_repl()
+    repl.process_line("10 LET A = 2")
+    repl.process_line("20 LET B = 1 + A * 3 - 8 / A / 2")
+    repl.process_line("30 LET C = (1 + A) * ((3 - A) - A)")
+    repl.process_line("40 LET D = 10 - A - 1")
+    repl.run_program()
+
+    assert repl.get_variable_value("B") == (5.0, "float")
+    assert repl.get_variable_value("C") == (-3.0, "float")
+    assert repl.get_variable_value("D") == (7.0, "float")
+
+
+def test_stored_lines_are_compiled():
+    """Lines are compiled and detokenized when stored, forgotten when deleted"""
+    repl = make_repl()
+    repl.process_line("10 LET A% = 6 * 7")
+    repl.process_line("20 LET A$ = 1")
+    assert 10 in repl.program_store.bytecode
+    assert repl.program_store.bytecode[20] is NotImplemented  # Falls back at RUN
+    assert repl.program_store.get_all_lines() == [(10, "LET A% = 6 * 7"), (20, "LET A$ = 1")]
+
+    repl.process_line("10")
+    assert 10 not in repl.program_store.bytecode
+    assert repl.program_store.get_line(10) is None
+
+    repl.process_line("10 LET A% = 1")
+    repl.new_program()
+    assert not repl.program_store.bytecode
+
+
+def test_out_of_memory_replace():
+    """A replace that runs out of memory leaves RUN agreeing with LIST"""
+    from core.memory import PROGRAM_END
+    repl = make_repl()
+    store = repl.program_store
+    memory = repl.memory_manager
+    repl.process_line("10 LET A = 1")
+
+    # Fill program memory to the last byte with REM lines
+    line_num = 20
+    while True:
+        free = PROGRAM_END - memory.program_top - 5  # Link, line number, EOL
+        if free <= 0:
+            break
+        filler = "X" * min(200, free - len(tokenize_line("REM ")))
+        store.add_line(line_num, "REM " + filler)
+        line_num += 10
+
+    # The longer line 10 fits, but the rebuild loses a line at the end
+    output = io.StringIO()
+    with redirect_stdout(output):
+        repl.process_line("10 LET A = 12345")
+    assert output.getvalue().startswith("Out of memory!")
+    assert store.line_numbers == [num for num, _ in memory.get_program_lines()]
+    assert set(store.bytecode) == set(store.line_numbers)
+
+    with redirect_stdout(io.StringIO()):
+        repl.run_program()
+    assert store.get_line(10) == "LET A = 12345"
+    assert repl.get_variable_value("A") == (12345.0, "float")
+
+
+def test_run_program():
+    """RUN executes compiled lines with co-processor math"""
+    repl = make_repl()
+    repl.process_line("10 LET A = 7 / 2")
+    repl.process_line("20 LET B% = A * 2 + 1")
+    repl.process_line("30 LET C = -A + (B% - 1)")
+    repl.run_program()
+
+    assert repl.get_variable_value("A") == (3.5, "float")
+    assert repl.get_variable_value("B%") == (8, "integer")
+    assert repl.get_variable_value("C") == (3.5, "float")
+
+
+def test_print():
+    """PRINT writes strings and numbers, with ; and , between them"""
+    repl = make_repl()
+    code = repl.token_executor.compile_line(tokenize_line('PRINT "A"; 2 + 3'))
+    assert code == [(OP_PUSH, "A"), (OP_PUSH, 5.0), (OP_PRINT, (";", ""))]
+
+    repl.process_line("LET A% = 7")
+    output = io.StringIO()
+    with redirect_stdout(output):
+        repl.process_line('PRINT "A%=";A%')
+        repl.process_line('PRINT 1, 2.5')
+        repl.process_line('PRINT')
+    assert output.getvalue() == "A%=7\n1         2.5\n\n"
+
+    # A trailing separator keeps the line open for the next PRINT
+    output = io.StringIO()
+    with redirect_stdout(output):
+        repl.process_line('10 PRINT "AB";')
+        repl.process_line('20 PRINT "C",')
+        repl.process_line('30 PRINT "D"')
+        repl.run_program()
+    assert output.getvalue() == "Running program...\nABC       D\n"
+
+    execute_line = repl.token_executor.execute_line
+
+    try:
+        execute_line(tokenize_line('PRINT "A" 5'))
+    except SyntaxError:
+        pass
+    else:
+        assert False, "Expected a SyntaxError"
+
+
+def test_address_cache_follows_clear():
+    """Cached variable addresses are dropped when the variables are cleared"""
+    repl = make_repl()
+    repl.process_line("10 LET B% = A% + 1")
+    repl.process_line("LET X = 1")
+    repl.process_line("LET A% = 5")
+    repl.run_program()
+    assert repl.get_variable_value("B%") == (6, "integer")
+
+    # Same names, different addresses this time round
+    repl.memory_manager.clear_variables()
+    repl.process_line("LET A% = 9")
+    repl.run_program()
+    assert repl.get_variable_value("A%") == (9, "integer")
+    assert repl.get_variable_value("B%") == (10, "integer")
+
+
+def test_immediate_let():
+    """Immediate mode statements go through the token executor too"""
+    repl = make_repl()
+    repl.process_line("LET A% = 6 * 7")
+    repl.process_line("LET B = A% + 0.5")
+
+    assert repl.get_variable_value("A%") == (42, "integer")
+    assert repl.get_variable_value("B") == (42.5, "float")
+
+    # The echo formats numbers the way PRINT does
+    output = io.StringIO()
+    with redirect_stdout(output):
+        repl.process_line("LET C = 1")
+        repl.process_line("LET D = 7 / 2")
+    assert output.getvalue() == "Variable C set to 1\nVariable D set to 3.5\n"
+
+
+def test_immediate_matches_run():
+    """Immediate statements use the same math and errors as RUN"""
+    repl = make_repl()
+    repl.process_line("LET B = 7 / 2")
+    assert repl.get_variable_value("B") == (3.5, "float")  # Not ALU integer division
+
+    # Undefined variables are an error, not 0
+    output = io.StringIO()
+    with redirect_stdout(output):
+        repl.process_line("LET C = Q + 1")
+    assert output.getvalue() == "Error: Undefined variable: Q\n"
+    assert repl.get_variable_value("C") is None
+
+    # TURBO/SLOW make no difference to numeric statements
+    repl.turbo = True
+    repl.process_line("LET D = 7 / 2")
+    repl.turbo = False
+    repl.process_line("LET E = 7 / 2")
+    assert repl.get_variable_value("D") == repl.get_variable_value("E") == (3.5, "float")
+
+
+def test_immediate_input_like_stored_lines():
+    """Immediate statements are cleaned up and checked like stored lines"""
+    repl = make_repl()
+    repl.process_line("LET A_B = 3")  # Underscores, as the grammar allows
+    assert repl.get_variable_value("A_B") == (3.0, "float")
+
+    repl.process_line("LET\tT\t=\t1")  # Tabs are whitespace too
+    assert repl.get_variable_value("T") == (1.0, "float")
+
+    # Spaces inside a number go, same as in a stored line
+    repl.process_line("LET C = 2 3")
+    repl.process_line("10 LET D = 2 3")
+    repl.run_program()
+    assert repl.get_variable_value("C") == repl.get_variable_value("D") == (23.0, "float")
+
+    # Anything left over after the statement is an error, not ignored
+    for line in ("LET E = 5)", "LET E = 1E40"):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            repl.process_line(line)
+        assert output.getvalue().startswith("Syntax error: Unexpected"), line
+    assert repl.get_variable_value("E") is None
+
+
+def test_undefined_variable_stops_run():
+    """Reading an undefined variable is a runtime error"""
+    repl = make_repl()
+    repl.process_line("10 LET A = Z")
+    repl.process_line("20 LET B = 1")
+    repl.run_program()
+
+    assert repl.get_variable_value("B") is None
+
+
+def test_overflow_stops_run():
+    """A value too big to store is a runtime error at its line"""
+    repl = make_repl()
+    repl.process_line("10 LET A = 2")
+    repl.process_line("20 LET B = A * 999999999 * 999999999 * 999999999 * 999999999 * 999999999")
+    repl.process_line("30 LET C = 1")
+    output = io.StringIO()
+    with redirect_stdout(output):
+        repl.run_program()
+
+    assert "Runtime error at line 20: Number out of range for B" in output.getvalue()
+    assert repl.get_variable_value("C") is None
+
+
+def test_runtime_errors_unwrapped():
+    """The transformer raises BASIC runtime errors as themselves"""
+    repl = make_repl()
+    tree = repl.parser.parse("LET A = 1 / 0")
+    try:
+        repl.transformer.transform(tree)
+    except BasicRuntimeError as e:
+        assert str(e) == "Division by zero"
+    else:
+        assert False, "Expected a BasicRuntimeError"
+
+    repl.process_line("LET A = 1 / 0")
+    assert repl.get_variable_value("A") is None
+
+
+def test_fallback_tree_cache():
+    """Parser fallback trees are cached by line text, so edits parse afresh"""
+    repl = make_repl()
+    repl.process_line("10 LET A$ = 1")  # String LET goes through the parser
+    repl.run_program()
+    tree_cache = repl.parser._tree_cache
+    assert "LET A$ = 1" in tree_cache
+
+    repl.process_line("10 LET B$ = 2")
+    output = io.StringIO()
+    with redirect_stdout(output):
+        repl.run_program()
+    assert "LET B$ = 2" in tree_cache
+    assert "Variable B$ set to 2" in output.getvalue()  # Not the old tree
+
+
+if __name__ == "__main__":
+    test_compile_let()
+    test_constant_folding()
+    test_operator_precedence()
+    test_stored_lines_are_compiled()
+    test_out_of_memory_replace()
+    test_run_program()
+    test_print()
+    test_address_cache_follows_clear()
+    test_immediate_let()
+    test_immediate_matches_run()
+    test_immediate_input_like_stored_lines()
+    test_undefined_variable_stops_run()
+    test_overflow_stops_run()
+    test_runtime_errors_unwrapped()
+    test_fallback_tree_cache()
+    print("Token executor tests passed!")